@@ -4,6 +4,7 @@ from .models import ReconcilationRecord
 
 
 class ReconcilationRecordAdmin(admin.ModelAdmin):
+    list_display = [field.name for field in ReconcilationRecord._meta.concrete_fields]
     search_fields = [
         "task_id",
     ]
@@ -12,8 +13,5 @@ class ReconcilationRecordAdmin(admin.ModelAdmin):
         "created_at",
     ]
 
-    def get_list_display(self, request):
-        return [field.name for field in self.model._meta.concrete_fields]
-
 
 admin.site.register(ReconcilationRecord, ReconcilationRecordAdmin)
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-15 09:05
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReconcilationRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_file', models.FileField(upload_to='csv/source_files/')),
+                ('target_file', models.FileField(upload_to='csv/target_files/')),
+                ('task_id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('status', models.CharField(choices=[('PROCESSING', 'PROCESSING'), ('SUCCESS', 'SUCCESS'), ('FAILED', 'FAILED')], default='PROCESSING', max_length=100)),
+                ('missing_data_in_source_file', models.JSONField(blank=True, null=True)),
+                ('missing_data_in_target_file', models.JSONField(blank=True, null=True)),
+                ('discrepancies', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', '-created_at'], name='reconcile_r_status_320a3c_idx')],
+            },
+        ),
+    ]
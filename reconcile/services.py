@@ -1,62 +1,337 @@
 import csv
-import json
-from typing import Any, Dict, List
+import datetime
+import io
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List
 
+import numpy as np
+import orjson
 import pandas as pd
+from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
-from django.http import HttpResponse, JsonResponse
-from django.template.loader import render_to_string
+from django.http import JsonResponse, StreamingHttpResponse
+from django.template.loader import get_template
+from django.utils import timezone
+from pandas.api.types import is_string_dtype
+from pandas.tseries.api import guess_datetime_format
 
 from .models import ReconcilationRecord, Status
 
+CSV_CHUNK_SIZE = 200_000
+
+# Explicit dtypes for the reconciled columns, so the CSV parser does not have to infer them.
+# Dates are read as strings and parsed in `normalize_data` with one format guessed per file, as `parse_dates`
+# would leave a whole column as plain strings if any of its dates could not be parsed.
+# Amounts must be numbers: a value that is not fails the read with an error naming the file.
+CSV_DTYPES = {
+    "id": "string[pyarrow]",
+    "name": "string[pyarrow]",
+    "date": "string[pyarrow]",
+    "amount": "float64",
+}
+
+# The UTC offset at the end of a date, such as "+01:00" or "-0230"
+UTC_OFFSET_PATTERN = r"([+-]\d{2}(?::?\d{2}){0,2})$"
+
+# Columns of a reconciled record, and the fields of it compared between the source and target
+RECORD_COLUMNS = ["id", "name", "date", "amount"]
+COMPARED_FIELDS = ["name", "date", "amount"]
+# Columns of a discrepancy as found in the joined data, and as written to the reports
+JOINED_DISCREPANCY_COLUMNS = [
+    "id",
+    "name_source",
+    "name_target",
+    "date_source",
+    "date_target",
+    "amount_source",
+    "amount_target",
+]
+DISCREPANCY_COLUMNS = ["id", "name", "target_name", "date", "target_date", "amount", "target_amount"]
+
+# Fields needed to report on a task; the uploaded files and timestamps are left unloaded
+RECORD_RESULT_FIELDS = [
+    "task_id",
+    "status",
+    "missing_data_in_source_file",
+    "missing_data_in_target_file",
+    "discrepancies",
+]
+RECORD_CACHE_TIMEOUT = 300
+
+# Uploads up to this size are also kept in the cache so the worker does not have to fetch them back from storage
+UPLOAD_CACHE_MAX_SIZE = 10 * 1024 * 1024
+UPLOAD_CACHE_TIMEOUT = 60 * 60
+
+# Rows rendered per template call when streaming the HTML report, bounding the memory held at any one time
+HTML_ROWS_PER_RENDER = 1_000
+
 
 class ReconcilationService:
     def __init__(self, record: ReconcilationRecord):
         self.record = record
 
-    def normalize_data(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+    def get_csv_dtypes(self, file) -> Dict[str, str]:
+        """
+        Map `CSV_DTYPES` onto the header of a CSV file, whose column names may differ in case and padding.
+
+        Args:
+            file: The CSV file (path or file-like object) to read the header of.
+
+        Raises:
+            KeyError: If any of the reconciled columns is missing from the file.
+
+        Returns:
+            Dict[str, str]: The dtypes keyed by the file's own column names.
+        """
+        columns = pd.read_csv(file, nrows=0).columns
+        if hasattr(file, "seek"):
+            file.seek(0)
+
+        dtypes = {col: CSV_DTYPES[col.lower().strip()] for col in columns if col.lower().strip() in CSV_DTYPES}
+
+        missing_columns = set(CSV_DTYPES) - {col.lower().strip() for col in dtypes}
+        if missing_columns:
+            raise KeyError(f"Columns {sorted(missing_columns)} are missing from one of the CSV files.")
+
+        return dtypes
+
+    def read_csv(self, file, file_name: str) -> pd.DataFrame:
+        """
+        Read the reconciled columns of a CSV file into Arrow-backed columns.
+
+        Args:
+            file: The CSV file (path or file-like object) to read.
+            file_name (str): The name of the file to use in errors, e.g. "source file".
+
+        Raises:
+            ValueError: If an amount is not a number.
+
+        Returns:
+            pd.DataFrame: The parsed data frame.
+        """
+        dtypes = self.get_csv_dtypes(file)
+        try:
+            return pd.read_csv(file, usecols=list(dtypes), dtype=dtypes, dtype_backend="pyarrow")
+        except ValueError as err:
+            raise ValueError(f"the {file_name} has an amount that is not a number ({err})") from err
+
+    def read_csv_in_chunks(self, file, file_name: str) -> Iterable[pd.DataFrame]:
+        """
+        Read the reconciled columns of a CSV file in chunks of `CSV_CHUNK_SIZE` rows,
+        so the whole file is never held in memory.
+
+        Args:
+            file: The CSV file (path or file-like object) to read.
+            file_name (str): The name of the file to use in errors, e.g. "target file".
+
+        Raises:
+            ValueError: If an amount is not a number.
+
+        Yields:
+            pd.DataFrame: The parsed chunks.
+        """
+        dtypes = self.get_csv_dtypes(file)
+        try:
+            with pd.read_csv(
+                file, usecols=list(dtypes), chunksize=CSV_CHUNK_SIZE, dtype=dtypes, dtype_backend="pyarrow"
+            ) as reader:
+                yield from reader
+        except ValueError as err:
+            raise ValueError(f"the {file_name} has an amount that is not a number ({err})") from err
+
+    def prefetch(self, iterator: Iterator[pd.DataFrame], executor: Executor) -> Iterator[pd.DataFrame]:
+        """
+        Fetch items from an iterator on the executor, one item ahead of the consumer.
+
+        The first item is requested straight away, so it is fetched while the caller is still busy.
+
+        Args:
+            iterator (Iterator[pd.DataFrame]): The iterator to fetch items from.
+            executor (Executor): The executor to fetch items on.
+
+        Returns:
+            Iterator[pd.DataFrame]: The fetched items.
+        """
+        future = executor.submit(next, iterator, None)
+
+        def fetch():
+            nonlocal future
+            while (item := future.result()) is not None:
+                future = executor.submit(next, iterator, None)
+                yield item
+
+        return fetch()
+
+    def guess_date_format(self, dataframe: pd.DataFrame) -> str | None:
+        """
+        Guess the format of the dates from the first non-empty date, as `pd.to_datetime` does for a whole column.
+
+        Args:
+            dataframe (pd.DataFrame): The data frame (or first chunk of a file) to guess the date format of.
+
+        Returns:
+            str | None: The date format, "mixed" if it cannot be guessed, or None if there are no dates.
+        """
+        dates = next(dataframe[col] for col in dataframe.columns if col.lower().strip() == "date")
+        dates = dates.dropna().str.strip().str.lower()
+        dates = dates[dates != ""]
+        if dates.empty:
+            return None
+
+        # Dates in a format that cannot be guessed are parsed one by one, which is what `pd.to_datetime` falls back to
+        return guess_datetime_format(dates.iloc[0]) or "mixed"
+
+    def normalize_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Normalize the chunks of a file, parsing the dates of every chunk with the format guessed for the file.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): The chunks of the file.
+
+        Yields:
+            pd.DataFrame: The normalized chunks.
+        """
+        date_format = None
+        for chunk in chunks:
+            if date_format is None:
+                date_format = self.guess_date_format(chunk)
+            yield self.normalize_data(chunk, date_format=date_format)
+
+    def normalize_data(self, dataframe: pd.DataFrame, date_format: str | None = None) -> pd.DataFrame:
         """
         Normalize data to handle case sensitivity, spaces, and date formats.
 
         Args:
             dataframe (pd.DataFrame): The data frame to normalize.
+            date_format (str | None): The format of the dates, guessed from the data frame itself if not given.
 
         Returns:
             pd.DataFrame: The normalized data frame.
         """
 
-        # Strip leading/trailing spaces and convert strings to lowercase
-        dataframe = dataframe.map(lambda x: x.strip().lower() if isinstance(x, str) else x)
-
         # Normalize column names to lowercase for both DataFrames
         dataframe.columns = [col.lower().strip() for col in dataframe.columns]
 
+        # Strip leading/trailing spaces and convert strings to lowercase, in the string columns only
+        for col, dtype in dataframe.dtypes.items():
+            if is_string_dtype(dtype):
+                dataframe[col] = dataframe[col].str.strip().str.lower()
+
         # Ensure 'id', 'name', 'date', and 'amount' columns are present
-        required_columns = ["id", "name", "date", "amount"]
-        for col in required_columns:
-            if col not in dataframe.columns:
-                raise KeyError(f"Column '{col}' is missing from one of the DataFrames.")
+        missing_columns = set(RECORD_COLUMNS) - set(dataframe.columns)
+        if missing_columns:
+            raise KeyError(f"Columns {sorted(missing_columns)} are missing from one of the DataFrames.")
 
         # Normalize the 'Date' column to a consistent date format, if it exists
         if "date" in dataframe.columns:
-            dataframe["date"] = pd.to_datetime(dataframe["date"], errors="coerce")
+            if date_format is None:
+                date_format = self.guess_date_format(dataframe)
+            dataframe["date"] = self.parse_dates(dataframe["date"], date_format=date_format)
 
         return dataframe
 
-    def reconcile_data(self, normalized_source_df: pd.DataFrame, normalized_target_df: pd.DataFrame) -> Dict[str, Any]:
+    def parse_dates(self, dates: pd.Series, date_format: str | None) -> pd.Series:
+        """
+        Parse dates in the given format, keeping the UTC offset each date was written with.
+
+        Dates with a single UTC offset are parsed into a timezone-aware column. Dates with several offsets are
+        parsed in UTC and converted back to each row's own offset, which leaves a column of timestamps.
+
+        Args:
+            dates (pd.Series): The dates as strings.
+            date_format (str | None): The format of the dates.
+
+        Returns:
+            pd.Series: The parsed dates, with NaT for dates that could not be parsed.
+        """
+        if date_format is None or "%z" not in date_format:
+            return pd.to_datetime(dates, format=date_format, errors="coerce")
+
+        # `%z` only reads an upper case "Z" for UTC, and the dates have been lowercased
+        dates = dates.str.replace(r"z$", "+00:00", regex=True)
+        parsed_dates = pd.to_datetime(dates, format=date_format, utc=True, errors="coerce")
+
+        # Group the offsets by the timezone they stand for, as the same offset may be written in several ways
+        offsets = dates.str.extract(UTC_OFFSET_PATTERN, expand=False)
+        timezones = {}
+        for offset in offsets.dropna().unique():
+            sign = -1 if offset.startswith("-") else 1
+            digits = offset.lstrip("+-").replace(":", "").ljust(6, "0")
+            hours, minutes, seconds = int(digits[0:2]), int(digits[2:4]), int(digits[4:6])
+            tz = datetime.timezone(sign * datetime.timedelta(hours=hours, minutes=minutes, seconds=seconds))
+            timezones.setdefault(tz, []).append(offset)
+
+        if len(timezones) <= 1:
+            return parsed_dates.dt.tz_convert(next(iter(timezones), datetime.timezone.utc))
+
+        mixed_dates = pd.Series(pd.NaT, index=dates.index, dtype=object)
+        for tz, tz_offsets in timezones.items():
+            in_tz = offsets.isin(tz_offsets).fillna(False).to_numpy(dtype=bool)
+            mixed_dates[in_tz] = parsed_dates[in_tz].dt.tz_convert(tz).astype(object)
+
+        return mixed_dates
+
+    def reconcile_data(
+        self, normalized_source_df: pd.DataFrame, normalized_target_dfs: Iterable[pd.DataFrame]
+    ) -> Dict[str, Any]:
         """
         Reconcile the source and target CSVs.
 
+        The source data is held in memory while the target data is streamed through it chunk by chunk.
+
         Args:
             normalized_source_df (pd.DataFrame): Source data frame.
-            normalized_target_df (pd.DataFrame): Target data frame.
+            normalized_target_dfs (Iterable[pd.DataFrame]): Target data frame chunks.
 
         Returns:
             Dict[str, Any]: Reconciliation results.
         """
-        missing_in_target = self.find_missing_in_target(normalized_source_df, normalized_target_df)
-        missing_in_source = self.find_missing_in_target(normalized_target_df, normalized_source_df)
-        discrepancies = self.find_discrepancies(normalized_source_df, normalized_target_df)
+        # Index the source by id once, so its hash table is built on the first join and reused for every chunk.
+        # The source positions track which source rows were matched by any target chunk.
+        source_df = normalized_source_df.reset_index(names="source_position").set_index("id")
+        if not source_df.index.is_unique:
+            raise ValueError("the source file contains duplicate IDs")
+        matched = np.zeros(len(source_df), dtype=bool)
+
+        # Duplicate target ids may be split across chunks, so the ids already seen are tracked too: matched ones
+        # through the source positions, and the others (which are all reported as missing anyway) in a set
+        unmatched_target_ids = set()
+        duplicate_target_ids = "the target file contains duplicate IDs"
+
+        missing_in_source = []
+        discrepancies = []
+        for normalized_target_df in normalized_target_dfs:
+            # An empty chunk (a header-only file) has nothing to reconcile
+            if normalized_target_df.empty:
+                continue
+            if normalized_target_df["id"].duplicated().any():
+                raise ValueError(duplicate_target_ids)
+            # Skip the join when it cannot match anything: every target row is missing from an empty source
+            if source_df.empty:
+                missing_df = normalized_target_df
+                missing_in_source.extend(self.format_missing_data(missing_df, suffix=""))
+            else:
+                joined_df = (
+                    normalized_target_df.set_index("id")
+                    .join(source_df, how="left", lsuffix="_target", rsuffix="_source")
+                    .reset_index()
+                )
+                is_matched = joined_df["source_position"].notna().to_numpy()
+                source_positions = joined_df.loc[is_matched, "source_position"].to_numpy(dtype=np.int64)
+                if matched[source_positions].any():
+                    raise ValueError(duplicate_target_ids)
+                matched[source_positions] = True
+
+                missing_df = joined_df[~is_matched]
+                missing_in_source.extend(self.format_missing_data(missing_df, suffix="_target"))
+                discrepancies.extend(self.find_discrepancies(joined_df[is_matched]))
+
+            missing_ids = missing_df["id"].to_numpy(dtype=object, na_value=None).tolist()
+            if not unmatched_target_ids.isdisjoint(missing_ids):
+                raise ValueError(duplicate_target_ids)
+            unmatched_target_ids.update(missing_ids)
+
+        missing_in_target = self.format_missing_data(source_df[~matched].reset_index(), suffix="")
 
         return {
             "missing_data_in_target_file": missing_in_target,
@@ -64,116 +339,180 @@ class ReconcilationService:
             "discrepancies": discrepancies,
         }
 
-    def find_missing_in_target(self, target_df: pd.DataFrame, source_df: pd.DataFrame) -> Dict[str, Any]:
+    def format_missing_data(self, missing_df: pd.DataFrame, suffix: str) -> List[Dict[str, Any]]:
         """
-        Find records in target that are missing in source.
+        Format missing data for output.
 
         Args:
-            target_df (pd.DataFrame): Target data frame.
-            source_df (pd.DataFrame): Source data frame.
+            missing_df (pd.DataFrame): Merged data frame with records found on one side only.
+            suffix (str): The merge suffix of the side the records were found on.
 
         Returns:
-            List[Dict[str, Any]]: Records missing in source.
+            List[Dict[str, Any]]: Formatted missing records.
         """
-        missing_in_source = pd.merge(target_df, source_df, how="left", on=["id", "name"], indicator=True).query(
-            '_merge == "left_only"'
+        # Pull each necessary column out once as Python values, with empty values as None
+        ids, names, amounts = (
+            missing_df[col].to_numpy(dtype=object, na_value=None).tolist()
+            for col in ["id", f"name{suffix}", f"amount{suffix}"]
         )
+        dates = self.format_dates(missing_df[f"date{suffix}"])
 
-        # Rename and format date and amount columns
-        return self.format_missing_data(missing_in_source)
+        # Zip the columns into records
+        return [
+            {"id": id_, "name": name, "date": date, "amount": amount}
+            for id_, name, date, amount in zip(ids, names, dates, amounts)
+        ]
 
-    def format_missing_data(self, missing_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def format_dates(self, dates: pd.Series) -> List[str | None]:
         """
-        Format missing data for output.
+        Format dates as ISO 8601 strings, which is cheaper through numpy than `Series.dt.strftime`.
+
+        As with `datetime.isoformat`, microseconds are only written when the time has a fraction of a second.
 
         Args:
-            missing_df (pd.DataFrame): Data frame with missing records.
+            dates (pd.Series): The parsed dates.
 
         Returns:
-            List[Dict[str, Any]]: Formatted missing records.
+            List[str | None]: The formatted dates, with None for missing dates.
         """
-        # Rename and convert dates to JSON serializable format
-        missing_df = missing_df.rename(columns={"date_x": "date", "amount_x": "amount"})
-        missing_df["date"] = missing_df["date"].apply(lambda x: x.isoformat() if pd.notnull(x) else None)
-
-        # Select only the necessary columns
-        return missing_df[["id", "name", "date", "amount"]].to_dict(orient="records")
-
-    def find_discrepancies(self, source_df: pd.DataFrame, target_df: pd.DataFrame) -> Dict[str, Any]:
+        if dates.dtype == object:
+            # Dates with mixed UTC offsets are parsed by `parse_dates` into timestamps, each in its own offset
+            return [None if pd.isna(date) else date.isoformat() for date in dates]
+
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            # Format the local wall-clock time, then append its UTC offset
+            wall_clock = dates.dt.tz_localize(None)
+            offsets = (wall_clock - dates.dt.tz_convert(None)).dt.total_seconds().to_numpy()
+            suffixes = {}
+            for offset in np.unique(offsets[~np.isnan(offsets)]):
+                hours, minutes = divmod(int(abs(offset)) // 60, 60)
+                suffixes[offset] = f"{'-' if offset < 0 else '+'}{hours:02d}:{minutes:02d}"
+
+            return [
+                None if date is None else date + suffixes[offset]
+                for date, offset in zip(self.format_dates(wall_clock), offsets)
+            ]
+
+        values = dates.to_numpy(dtype="datetime64[us]")
+        formatted = np.datetime_as_string(values, unit="us")
+        # Truncating the strings to "YYYY-MM-DDTHH:MM:SS" drops an all-zero fraction
+        has_fraction = values.view("i8") % 1_000_000 != 0
+        formatted = np.where(has_fraction, formatted, formatted.astype("<U19")).astype(object)
+        formatted[np.isnat(values)] = None
+        return formatted.tolist()
+
+    def find_discrepancies(self, merged_df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
         Find discrepancies between source and target data.
 
         Args:
-            source_df (pd.DataFrame): Source data frame.
-            target_df (pd.DataFrame): Target data frame.
+            merged_df (pd.DataFrame): Merged data frame with records found on both sides.
 
         Returns:
             List[Dict[str, Any]]: Records with discrepancies.
         """
-        common_columns = ["id"]
-        discrepancies = pd.merge(source_df, target_df, on=common_columns, suffixes=("_source", "_target"))
-
-        mask = (
-            (discrepancies["name_source"] != discrepancies["name_target"])
-            | (discrepancies["date_source"] != discrepancies["date_target"])
-            | (discrepancies["amount_source"] != discrepancies["amount_target"])
+        if merged_df.empty:
+            return []
+
+        # Flag the rows where each field differs between source and target, where two empty values match.
+        # Dates are compared as int64 nanoseconds, where NaT equals NaT.
+        date_source, date_target = (
+            # Dates with mixed UTC offsets are parsed into timestamps by `parse_dates`, so convert them to UTC first
+            (pd.to_datetime(dates, utc=True) if dates.dtype == object else dates)
+            .to_numpy(dtype="datetime64[ns]")
+            .view("i8")
+            for dates in [merged_df["date_source"], merged_df["date_target"]]
         )
+        date_differs = date_source != date_target
+
+        amount_source = merged_df["amount_source"].to_numpy(dtype=np.float64, na_value=np.nan)
+        amount_target = merged_df["amount_target"].to_numpy(dtype=np.float64, na_value=np.nan)
+        both_nan = np.isnan(amount_source)
+        both_nan &= np.isnan(amount_target)
+        amount_differs = amount_source != amount_target
+        amount_differs &= ~both_nan
 
-        # Apply the mask to filter the DataFrame
-        filtered_discrepancies = discrepancies[mask].copy()
+        name_source, name_target = merged_df["name_source"], merged_df["name_target"]
+        name_matches = (name_source == name_target).fillna(False) | (name_source.isna() & name_target.isna())
+        name_differs = ~name_matches.to_numpy(dtype=bool)
+
+        mask = date_differs | amount_differs
+        mask |= name_differs
+
+        # Apply the mask, keeping only the columns needed for the output
+        filtered_discrepancies = merged_df.loc[mask, JOINED_DISCREPANCY_COLUMNS]
+        differing_fields = {"name": name_differs[mask], "date": date_differs[mask], "amount": amount_differs[mask]}
 
         # Convert dates and return the formatted discrepancies
-        return self.format_discrepancies(filtered_discrepancies)
+        return self.format_discrepancies(filtered_discrepancies, differing_fields)
 
-    def format_discrepancies(self, discrepancies_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def format_discrepancies(
+        self, discrepancies_df: pd.DataFrame, differing_fields: Dict[str, np.ndarray]
+    ) -> List[Dict[str, Any]]:
         """
         Format discrepancies for output.
 
         Args:
             discrepancies_df (pd.DataFrame): Data frame with discrepancies.
+            differing_fields (Dict[str, np.ndarray]): For each compared field, the rows where it differs.
 
         Returns:
             List[Dict[str, Any]]: Formatted discrepancies.
         """
-        discrepancies_df["date_source"] = discrepancies_df["date_source"].apply(
-            lambda x: x.isoformat() if pd.notnull(x) else None
-        )
-        discrepancies_df["date_target"] = discrepancies_df["date_target"].apply(
-            lambda x: x.isoformat() if pd.notnull(x) else None
-        )
+        # Pull each column out once as Python values, with empty values as None
+        ids = discrepancies_df["id"].to_numpy(dtype=object, na_value=None).tolist()
+        fields = {}
+        for key in COMPARED_FIELDS:
+            source, target = discrepancies_df[f"{key}_source"], discrepancies_df[f"{key}_target"]
+            if key == "date":
+                fields[key] = (differing_fields[key], self.format_dates(source), self.format_dates(target))
+            else:
+                fields[key] = (
+                    differing_fields[key],
+                    source.to_numpy(dtype=object, na_value=None).tolist(),
+                    target.to_numpy(dtype=object, na_value=None).tolist(),
+                )
+
+        # Build the records with only the fields that differ
+        discrepancies = []
+        for index, id_ in enumerate(ids):
+            discrepancy = {"id": id_}
+            for key, (differs, source_values, target_values) in fields.items():
+                if differs[index]:
+                    discrepancy[key] = source_values[index]
+                    discrepancy[f"target_{key}"] = target_values[index]
+            discrepancies.append(discrepancy)
 
-        # Rename columns for clarity
-        discrepancies_df = discrepancies_df.rename(
-            columns={
-                "date_source": "date",
-                "amount_source": "amount",
-                "date_target": "target_date",
-                "amount_target": "target_amount",
-                "name_source": "name",
-                "name_target": "target_name",
-            }
-        )
+        return discrepancies
 
-        # Return only the records with discrepancies
-        discrepancies = discrepancies_df[
-            ["id", "name", "target_name", "date", "target_date", "amount", "target_amount"]
-        ].to_dict(orient="records")
+    @classmethod
+    def get_record(cls, task_id: str) -> ReconcilationRecord | None:
+        """
+        Fetch the record for a task, serving finished records from the cache
 
-        keys = ["name", "date", "amount"]
-        for discrepancy in discrepancies:
-            for key in keys:
-                target_key = f"target_{key}"
-                if discrepancy[key] == discrepancy[target_key]:
-                    del discrepancy[key]
-                    del discrepancy[target_key]
+        Args:
+            task_id (str): The task ID of the record
 
-        return discrepancies
+        Returns:
+            ReconcilationRecord | None: The record with only the result fields loaded, or None if it does not exist
+        """
+        cache_key = f"recon:{task_id}"
+        record = cache.get(cache_key)
+        if record is not None:
+            return record
+
+        record = ReconcilationRecord.objects.only(*RECORD_RESULT_FIELDS).filter(task_id=task_id).first()
+
+        # Results are never written again once the task has finished, so only then is the record safe to cache
+        if record is not None and record.status in (Status.SUCCESS, Status.FAILED):
+            cache.set(cache_key, record, RECORD_CACHE_TIMEOUT)
+
+        return record
 
     @classmethod
     def get_reconcilation_result(cls, task_id: str) -> ReconcilationRecord:
-        try:
-            record = ReconcilationRecord.objects.get(task_id=task_id)
-        except ReconcilationRecord.DoesNotExist:
+        record = cls.get_record(task_id=task_id)
+        if record is None:
             raise ValueError("this task ID does not exist")
 
         return record
@@ -185,8 +524,35 @@ class ReconcilationService:
             target_file=target_file,
         )
 
+        uploads = {"src": source_file, "tgt": target_file}
+        cache.set_many(
+            {
+                f"recon:{kind}:{reconcilation_record.task_id}": b"".join(file.chunks())
+                for kind, file in uploads.items()
+                if file.size <= UPLOAD_CACHE_MAX_SIZE
+            },
+            UPLOAD_CACHE_TIMEOUT,
+        )
+
         return reconcilation_record
 
+    def open_file(self, kind: str, file_field):
+        """
+        Open an uploaded file, preferring the copy cached by `create_record` over the storage backend
+
+        Args:
+            kind (str): Either "src" or "tgt"
+            file_field: The record's file field to fall back to
+
+        Returns:
+            The cached contents as a bytes buffer, or the file field itself
+        """
+        content = cache.get(f"recon:{kind}:{self.record.task_id}")
+        if content is None:
+            return file_field
+
+        return io.BytesIO(content)
+
     @classmethod
     def update_record(cls, data: Dict[str, Any], record: ReconcilationRecord) -> ReconcilationRecord:
         """
@@ -199,20 +565,45 @@ class ReconcilationService:
         Returns:
             ReconcilationRecord: The updated reconcilation record
         """
+        # Only write the given columns, rather than every field as `record.save()` would.
+        # `update()` skips `auto_now`, so `updated_at` is set explicitly.
+        data = {**data, "updated_at": timezone.now()}
+        ReconcilationRecord.objects.filter(pk=record.pk).update(**data)
+
         for key, value in data.items():
             setattr(record, key, value)
 
-        record.save()
         return record
 
     def reconcile_and_save_data(self):
-        source_df = self.normalize_data(pd.read_csv(self.record.source_file))
-        target_df = self.normalize_data(pd.read_csv(self.record.target_file))
+        try:
+            # Load the source file and the target chunks concurrently, the files are independent of each other
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_file = self.open_file("src", self.record.source_file)
+                target_file = self.open_file("tgt", self.record.target_file)
+                source_future = executor.submit(
+                    lambda: self.normalize_data(self.read_csv(source_file, file_name="source file"))
+                )
+                target_dfs = self.prefetch(
+                    self.normalize_chunks(self.read_csv_in_chunks(target_file, file_name="target file")), executor
+                )
+
+                reconciled_data = self.reconcile_data(
+                    normalized_source_df=source_future.result(), normalized_target_dfs=target_dfs
+                )
+            reconciled_data["status"] = Status.SUCCESS
+
+            self.update_record(data=reconciled_data, record=self.record)
+        finally:
+            # The cached uploads are not needed again whether or not the reconciliation succeeded
+            cache.delete_many([f"recon:src:{self.record.task_id}", f"recon:tgt:{self.record.task_id}"])
 
-        reconciled_data = self.reconcile_data(normalized_source_df=source_df, normalized_target_df=target_df)
-        reconciled_data["status"] = Status.SUCCESS
 
-        self.update_record(data=reconciled_data, record=self.record)
+class Echo:
+    """A file-like object whose `write` returns the value, so `csv.writer` rows can be streamed."""
+
+    def write(self, value: str) -> str:
+        return value
 
 
 class OutputFormattingService:
@@ -229,9 +620,8 @@ class OutputFormattingService:
 
         self.file_format = file_format
 
-        try:
-            record = ReconcilationRecord.objects.get(task_id=task_id)
-        except ReconcilationRecord.DoesNotExist:
+        record = ReconcilationService.get_record(task_id=task_id)
+        if record is None:
             raise ValueError(f"record with ID, {task_id}, does not exist")
 
         self.record = record
@@ -254,58 +644,77 @@ class OutputFormattingService:
             return self.generate_csv_response()
 
     def generate_json_response(self):
-        """Generate a JSON file for download."""
+        """Generate a compact JSON file for download, streamed one section at a time."""
         report_data = self.report_data
-        response = HttpResponse(content_type="application/json")
+
+        def sections():
+            yield b"{"
+            for position, (key, rows) in enumerate(report_data.items()):
+                yield (b"," if position else b"") + orjson.dumps(key) + b":" + orjson.dumps(rows)
+            yield b"}"
+
+        response = StreamingHttpResponse(sections(), content_type="application/json")
         response["Content-Disposition"] = "attachment; filename=reconciliation_report.json"
-        json.dump(report_data, response, indent=4)
         return response
 
     def generate_csv_response(self):
-        """Generate a CSV file for download."""
+        """Generate a CSV file for download, streamed one section at a time."""
         report_data = self.report_data
-
-        response = HttpResponse(content_type="text/csv")
+        writer = csv.writer(Echo())
+
+        def section(title: str, rows: List[Dict[str, Any]], columns: List[str]) -> Iterator[str]:
+            # Build the section as a frame so pandas' C writer serializes it instead of a per-row Python loop
+            yield writer.writerow([title])
+            # Object columns keep each value as saved, so integers are not upcast to floats next to missing keys
+            yield pd.DataFrame(rows, columns=columns, dtype=object).to_csv(index=False, lineterminator="\r\n")
+
+        def sections():
+            yield from section("Missing in Source File", report_data["missing_data_in_source_file"], RECORD_COLUMNS)
+            yield writer.writerow([])
+            yield from section("Missing in Target File", report_data["missing_data_in_target_file"], RECORD_COLUMNS)
+            yield writer.writerow([])
+            yield from section("Discrepancies", report_data["discrepancies"], DISCREPANCY_COLUMNS)
+
+        response = StreamingHttpResponse(sections(), content_type="text/csv")
         response["Content-Disposition"] = "attachment; filename=reconciliation_report.csv"
-
-        writer = csv.writer(response)
-
-        # Write headers for each section
-        missing_columns = ["id", "name", "date", "amount"]
-        writer.writerow(["Missing in Source File"])
-        writer.writerow(missing_columns)
-        for row in report_data["missing_data_in_source_file"]:
-            writer.writerow([row.get(missing_column, "") for missing_column in missing_columns])
-
-        writer.writerow([])
-        writer.writerow(["Missing in Target File"])
-        writer.writerow(missing_columns)
-        for row in report_data["missing_data_in_target_file"]:
-            writer.writerow([row.get(missing_column, "") for missing_column in missing_columns])
-
-        writer.writerow([])
-        writer.writerow(["Discrepancies"])
-        discrepancy_columns = ["id", "name", "target_name", "date", "target_date", "amount", "target_amount"]
-        writer.writerow(discrepancy_columns)
-        for row in report_data["discrepancies"]:
-            writer.writerow([row.get(discrepancy_column, "") for discrepancy_column in discrepancy_columns])
-
         return response
 
     def generate_html_response(self):
-        """Generate an HTML file for download."""
+        """Generate an HTML file for download, streamed in batches of rows."""
         report_data = self.report_data
-        response = HttpResponse(content_type="text/html")
-        response["Content-Disposition"] = "attachment; filename=reconciliation_report.html"
-
-        html_content = render_to_string(
-            template_name="reconcilation_report_template.html",
-            context={
-                "missing_data_in_source_file": report_data["missing_data_in_source_file"],
-                "missing_data_in_target_file": report_data["missing_data_in_target_file"],
-                "discrepancies": report_data["discrepancies"],
-            },
+        # The template loader caches compiled templates, so only the first report pays for parsing them
+        header, section_header, rows_template, section_footer, footer = (
+            get_template(f"reconcilation_report/{name}.html")
+            for name in ["header", "section_header", "rows", "section_footer", "footer"]
         )
 
-        response.write(html_content)
+        def section(
+            title: str, rows: List[Dict[str, Any]] | None, columns: List[str], headings: List[str]
+        ) -> Iterator[str]:
+            # The results are not set until the task has finished, which renders as an empty table
+            rows = rows or []
+            yield section_header.render({"title": title, "headings": headings})
+            for start in range(0, len(rows), HTML_ROWS_PER_RENDER):
+                batch = rows[start : start + HTML_ROWS_PER_RENDER]
+                yield rows_template.render({"rows": [[row.get(column, "") for column in columns] for row in batch]})
+            yield section_footer.render()
+
+        def sections():
+            missing_headings = ["ID", "Name", "Date", "Amount"]
+            discrepancy_headings = ["ID", "Name", "Target Name", "Date", "Target Date", "Amount", "Target Amount"]
+
+            yield header.render()
+            yield from section(
+                "Missing in Source File", report_data["missing_data_in_source_file"], RECORD_COLUMNS, missing_headings
+            )
+            yield from section(
+                "Missing in Target File", report_data["missing_data_in_target_file"], RECORD_COLUMNS, missing_headings
+            )
+            yield from section(
+                "Discrepancies", report_data["discrepancies"], DISCREPANCY_COLUMNS, discrepancy_headings
+            )
+            yield footer.render()
+
+        response = StreamingHttpResponse(sections(), content_type="text/html")
+        response["Content-Disposition"] = "attachment; filename=reconciliation_report.html"
         return response
@@ -41,6 +41,7 @@ def trigger_reconcilation(task_id: str) -> Dict[str, Any]:
         reconcilation_service = ReconcilationService(record=record)
         reconcilation_service.reconcile_and_save_data()
     except ValueError as err:
+        ReconcilationService.update_record(data={"status": Status.FAILED}, record=record)
         return generate_result(status=False, message=f"an error occurred", error=str(err))
 
     return generate_result(message=f"task, with ID, {task_id}, processed and saved successfully")
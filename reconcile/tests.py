@@ -1,3 +1,325 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+import pandas as pd
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .models import ReconcilationRecord, Status
+from .services import OutputFormattingService, ReconcilationService
+from .tasks import trigger_reconcilation
+
+MEDIA_ROOT = tempfile.mkdtemp()
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+SOURCE_CSV = """ID,Name,Date,Amount
+001,John Doe,2023-01-01,100.00
+002,Jane Smith,2023-01-02,200.50
+003,Robert Brown,2023-01-03,300.75
+004,Emily White,2023-01-04,400.90
+005,Al Pha,,50
+"""
+
+TARGET_CSV = """id , NAME,date,amount
+001, john doe ,2023-01-01,100
+005,al pha,,55
+002,Jane Smith,2023-01-05,200.50
+006,Bet A,2023-01-06,
+004,Emily Whyte,2023-01-04,400.90
+"""
+
+
+def upload(name: str, content: str) -> SimpleUploadedFile:
+    return SimpleUploadedFile(name, content.encode(), content_type="text/csv")
+
+
+class FormatDatesTestCase(SimpleTestCase):
+    def format_dates(self, dates):
+        # Parse the dates the same way `normalize_data` does
+        service = ReconcilationService(record=None)
+        dates = pd.DataFrame({"date": pd.Series(dates, dtype="string[pyarrow]").str.lower()})
+        parsed_dates = service.parse_dates(dates["date"], date_format=service.guess_date_format(dates))
+        return service.format_dates(parsed_dates)
+
+    def test_naive_dates(self):
+        self.assertEqual(
+            self.format_dates(["2023-01-01T10:00:00", None]),
+            ["2023-01-01T10:00:00", None],
+        )
+
+    def test_sub_second_dates(self):
+        self.assertEqual(
+            self.format_dates(["2023-01-01T10:00:00.250", "2023-01-01T10:00:01.000"]),
+            ["2023-01-01T10:00:00.250000", "2023-01-01T10:00:01"],
+        )
+
+    def test_timezone_aware_dates(self):
+        self.assertEqual(
+            self.format_dates(["2023-01-01T00:00:00+01:00", None]),
+            ["2023-01-01T00:00:00+01:00", None],
+        )
+
+    def test_mixed_utc_offsets(self):
+        self.assertEqual(
+            self.format_dates(
+                ["2023-01-01T00:00:00+01:00", "2023-01-02T00:00:00-0230", None, "2023-01-03T00:00:00Z"]
+            ),
+            ["2023-01-01T00:00:00+01:00", "2023-01-02T00:00:00-02:30", None, "2023-01-03T00:00:00+00:00"],
+        )
+
+    def test_same_utc_offset_written_differently(self):
+        self.assertEqual(
+            self.format_dates(["2023-01-01T00:00:00+01:00", "2023-01-02T00:00:00+0100"]),
+            ["2023-01-01T00:00:00+01:00", "2023-01-02T00:00:00+01:00"],
+        )
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES=TEST_CACHES)
+class ReconcilationServiceTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.addClassCleanup(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def reconcile(self, source: str, target: str) -> ReconcilationRecord:
+        record = ReconcilationService.create_record(
+            source_file=upload("source.csv", source),
+            target_file=upload("target.csv", target),
+        )
+        ReconcilationService(record=record).reconcile_and_save_data()
+        return ReconcilationRecord.objects.get(pk=record.pk)
+
+    def test_reconcile(self):
+        record = self.reconcile(SOURCE_CSV, TARGET_CSV)
+
+        self.assertEqual(record.status, Status.SUCCESS)
+        self.assertEqual(
+            record.missing_data_in_source_file,
+            [{"id": "006", "name": "bet a", "date": "2023-01-06T00:00:00", "amount": None}],
+        )
+        self.assertEqual(
+            record.missing_data_in_target_file,
+            [{"id": "003", "name": "robert brown", "date": "2023-01-03T00:00:00", "amount": 300.75}],
+        )
+        self.assertEqual(
+            record.discrepancies,
+            [
+                {"id": "005", "amount": 50.0, "target_amount": 55.0},
+                {"id": "002", "date": "2023-01-02T00:00:00", "target_date": "2023-01-05T00:00:00"},
+                {"id": "004", "name": "emily white", "target_name": "emily whyte"},
+            ],
+        )
+
+    def test_target_split_across_chunks(self):
+        # The date format is guessed from the first date of a file, and holds for every chunk of it
+        day_first_csv = "id,name,date,amount\n1,a,13/02/2023,1\n2,b,01/02/2023,2\n"
+        iso_csv = "id,name,date,amount\n1,a,2023-01-05,1\n2,b,2023-01-02,2\n"
+        iso_then_day_first_csv = "id,name,date,amount\n1,a,2023-01-05,1\n2,b,01/02/2023,2\n"
+        cases = {
+            "iso dates": (SOURCE_CSV, TARGET_CSV, None),
+            "day-first dates": (day_first_csv, day_first_csv, []),
+            "dates not in the file's format": (
+                iso_csv,
+                iso_then_day_first_csv,
+                [{"id": "2", "date": "2023-01-02T00:00:00", "target_date": None}],
+            ),
+        }
+        for name, (source, target, discrepancies) in cases.items():
+            expected = self.reconcile(source, target)
+            if discrepancies is not None:
+                self.assertEqual(expected.discrepancies, discrepancies)
+
+            for chunk_size in [1, 2, 3]:
+                with self.subTest(name, chunk_size=chunk_size), mock.patch(
+                    "reconcile.services.CSV_CHUNK_SIZE", chunk_size
+                ):
+                    record = self.reconcile(source, target)
+                    self.assertEqual(record.missing_data_in_source_file, expected.missing_data_in_source_file)
+                    self.assertEqual(record.missing_data_in_target_file, expected.missing_data_in_target_file)
+                    self.assertEqual(record.discrepancies, expected.discrepancies)
+
+    def test_empty_source(self):
+        record = self.reconcile("id,name,date,amount\n", TARGET_CSV)
+
+        missing_ids = [row["id"] for row in record.missing_data_in_source_file]
+        self.assertEqual(missing_ids, ["001", "005", "002", "006", "004"])
+        self.assertEqual(record.missing_data_in_target_file, [])
+        self.assertEqual(record.discrepancies, [])
+
+    def test_empty_target(self):
+        record = self.reconcile(SOURCE_CSV, "id,name,date,amount\n")
+
+        self.assertEqual(record.missing_data_in_source_file, [])
+        missing_ids = [row["id"] for row in record.missing_data_in_target_file]
+        self.assertEqual(missing_ids, ["001", "002", "003", "004", "005"])
+        self.assertEqual(record.discrepancies, [])
+
+    def test_missing_values_on_both_sides_match(self):
+        source = "id,name,date,amount\n1,,,\n2,a,,1\n3,b,2023-01-01,\n"
+        target = "id,name,date,amount\n1,,,\n2,a,2023-01-02,1\n3,,2023-01-01,\n"
+        record = self.reconcile(source, target)
+
+        self.assertEqual(
+            record.discrepancies,
+            [
+                {"id": "2", "date": None, "target_date": "2023-01-02T00:00:00"},
+                {"id": "3", "name": "b", "target_name": None},
+            ],
+        )
+
+    def test_duplicate_ids(self):
+        cases = {
+            "source": (SOURCE_CSV + "001,John Doe,2023-01-01,100.00\n", TARGET_CSV),
+            "matched target": (SOURCE_CSV, TARGET_CSV + "001,John Doe,2023-01-01,100.00\n"),
+            "unmatched target": (SOURCE_CSV, TARGET_CSV + "006,Bet A,2023-01-06,\n"),
+        }
+        for name, (source, target) in cases.items():
+            for chunk_size in [1, 100]:
+                with self.subTest(name, chunk_size=chunk_size), mock.patch(
+                    "reconcile.services.CSV_CHUNK_SIZE", chunk_size
+                ):
+                    with self.assertRaisesMessage(ValueError, "contains duplicate IDs"):
+                        self.reconcile(source, target)
+
+    def test_non_numeric_amount(self):
+        for chunk_size in [1, 100]:
+            with self.subTest(chunk_size=chunk_size), mock.patch("reconcile.services.CSV_CHUNK_SIZE", chunk_size):
+                with self.assertRaisesMessage(ValueError, "the source file has an amount that is not a number"):
+                    self.reconcile(SOURCE_CSV + "006,Bet A,2023-01-06,$100\n", TARGET_CSV)
+                with self.assertRaisesMessage(ValueError, "the target file has an amount that is not a number"):
+                    self.reconcile(SOURCE_CSV, TARGET_CSV + "007,Gam Ma,2023-01-07,\"1,000\"\n")
+
+    def test_failed_task_marks_record_failed(self):
+        record = ReconcilationService.create_record(
+            source_file=upload("source.csv", SOURCE_CSV + "001,John Doe,2023-01-01,100.00\n"),
+            target_file=upload("target.csv", TARGET_CSV),
+        )
+
+        result = trigger_reconcilation(record.task_id)
+
+        self.assertEqual(result["error"], "the source file contains duplicate IDs")
+        self.assertEqual(ReconcilationRecord.objects.get(pk=record.pk).status, Status.FAILED)
+
+    def test_uploads_are_cached_until_reconciled(self):
+        record = ReconcilationService.create_record(
+            source_file=upload("source.csv", SOURCE_CSV),
+            target_file=upload("target.csv", TARGET_CSV),
+        )
+        self.assertEqual(cache.get(f"recon:src:{record.task_id}"), SOURCE_CSV.encode())
+        self.assertEqual(cache.get(f"recon:tgt:{record.task_id}"), TARGET_CSV.encode())
+
+        ReconcilationService(record=record).reconcile_and_save_data()
+
+        self.assertIsNone(cache.get(f"recon:src:{record.task_id}"))
+        self.assertIsNone(cache.get(f"recon:tgt:{record.task_id}"))
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES=TEST_CACHES)
+class OutputFormattingServiceTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.successful_record = ReconcilationRecord.objects.create(
+            source_file="csv/source_files/source.csv",
+            target_file="csv/target_files/target.csv",
+            status=Status.SUCCESS,
+            missing_data_in_source_file=[{"id": "006", "name": "bet a", "date": None, "amount": 1}],
+            missing_data_in_target_file=[],
+            discrepancies=[{"id": "005", "amount": 50.0, "target_amount": 55.0}],
+        )
+        self.processing_record = ReconcilationRecord.objects.create(
+            source_file="csv/source_files/source.csv",
+            target_file="csv/target_files/target.csv",
+        )
+
+    def generate_report(self, record: ReconcilationRecord, file_format: str) -> str:
+        service = OutputFormattingService(file_format=file_format, task_id=record.task_id)
+        response = service.generate_file_format_response()
+        self.assertEqual(
+            response["Content-Disposition"], f"attachment; filename=reconciliation_report.{file_format}"
+        )
+        return b"".join(response.streaming_content).decode()
+
+    def test_finished_records_are_cached(self):
+        task_id = self.successful_record.task_id
+        ReconcilationService.get_record(task_id=task_id)
+        self.assertIsNotNone(cache.get(f"recon:{task_id}"))
+
+        with CaptureQueriesContext(connection) as queries:
+            record = ReconcilationService.get_record(task_id=task_id)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(record.discrepancies, self.successful_record.discrepancies)
+
+    def test_processing_records_are_not_cached(self):
+        task_id = self.processing_record.task_id
+        self.assertEqual(ReconcilationService.get_record(task_id=task_id).status, Status.PROCESSING)
+        self.assertIsNone(cache.get(f"recon:{task_id}"))
+
+        ReconcilationRecord.objects.filter(pk=self.processing_record.pk).update(status=Status.SUCCESS)
+        self.assertEqual(ReconcilationService.get_record(task_id=task_id).status, Status.SUCCESS)
+
+    def test_json_report(self):
+        self.assertEqual(
+            json.loads(self.generate_report(self.successful_record, "json")),
+            {
+                "missing_data_in_source_file": [{"id": "006", "name": "bet a", "date": None, "amount": 1}],
+                "missing_data_in_target_file": [],
+                "discrepancies": [{"id": "005", "amount": 50.0, "target_amount": 55.0}],
+            },
+        )
+        self.assertEqual(
+            json.loads(self.generate_report(self.processing_record, "json")),
+            {"missing_data_in_source_file": None, "missing_data_in_target_file": None, "discrepancies": None},
+        )
+
+    def test_csv_report(self):
+        self.assertEqual(
+            list(csv.reader(io.StringIO(self.generate_report(self.successful_record, "csv")))),
+            [
+                ["Missing in Source File"],
+                ["id", "name", "date", "amount"],
+                ["006", "bet a", "", "1"],
+                [],
+                ["Missing in Target File"],
+                ["id", "name", "date", "amount"],
+                [],
+                ["Discrepancies"],
+                ["id", "name", "target_name", "date", "target_date", "amount", "target_amount"],
+                ["005", "", "", "", "", "50.0", "55.0"],
+            ],
+        )
+        self.assertEqual(
+            list(csv.reader(io.StringIO(self.generate_report(self.processing_record, "csv")))),
+            [
+                ["Missing in Source File"],
+                ["id", "name", "date", "amount"],
+                [],
+                ["Missing in Target File"],
+                ["id", "name", "date", "amount"],
+                [],
+                ["Discrepancies"],
+                ["id", "name", "target_name", "date", "target_date", "amount", "target_amount"],
+            ],
+        )
+
+    def test_html_report(self):
+        report = self.generate_report(self.successful_record, "html")
+        self.assertInHTML("<tr><td>006</td><td>bet a</td><td>None</td><td>1</td></tr>", report)
+        self.assertInHTML(
+            "<tr><td>005</td><td></td><td></td><td></td><td></td><td>50.0</td><td>55.0</td></tr>", report
+        )
+        self.assertTrue(report.rstrip().endswith("</html>"))
+
+        report = self.generate_report(self.processing_record, "html")
+        self.assertEqual(report.count("<tbody>"), 3)
+        self.assertNotIn("<td>", report)
+        self.assertTrue(report.rstrip().endswith("</html>"))